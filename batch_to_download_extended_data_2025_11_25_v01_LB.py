@@ -18,40 +18,58 @@ Options:
     python wyoming_sounding_batch_downloader.py 15420 2022-01-10 2022-01-15 \
         --hours 00 --sep comma --outdir /path/to/save
 
+    # Fewer parallel downloads
+    python wyoming_sounding_batch_downloader.py 15420 2022-01-10 2022-01-15 --workers 2
+
+    # One combined table for the whole range instead of one file per sounding
+    python wyoming_sounding_batch_downloader.py 15420 2022-01-10 2022-01-15 --output-format csv
+    python wyoming_sounding_batch_downloader.py 15420 2022-01-10 2022-01-15 --output-format parquet
+
 By default, the script requests soundings at 00Z and 12Z for every day in the interval.
+Up to --workers soundings (default: MAX_CONCURRENT_REQUESTS) are downloaded at the same time.
 """
 
 import argparse
+import asyncio
+import csv
 import datetime as dt
+import gzip
+import io
+import os
 import sys
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 try:
     # This assumes wyoming_sounding_downloader.py is in the same directory
-    from wyoming_sounding_downloader_2025_11_25_v02_LB import fetch_sounding
+    from wyoming_sounding_downloader_2025_11_25_v02_LB import (
+        HTTPSession,
+        ensure_output_dir,
+        fetch_sounding_async,
+        parse_date,
+    )
 except ImportError as e:
     print("Error: could not import wyoming_sounding_downloader.", file=sys.stderr)
     print("Make sure wyoming_sounding_downloader.py is in the same directory or in PYTHONPATH.", file=sys.stderr)
     raise
 
+try:
+    # Optional, only needed for --output-format parquet
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
 
-def parse_date_only(date_str: str) -> dt.date:
-    """
-    Parse a date string into a date object.
+# Keep the number of simultaneous requests low to be polite to weather.uwyo.edu
+MAX_CONCURRENT_REQUESTS = 8
 
-    Accepted formats:
-        YYYY-MM-DD
-        YYYYMMDD
-        DD.MM.YYYY
-    """
-    formats = ["%Y-%m-%d", "%Y%m%d", "%d.%m.%Y"]
-    last_err = None
-    for f in formats:
-        try:
-            return dt.datetime.strptime(date_str, f).date()
-        except ValueError as e:
-            last_err = e
-    raise ValueError(f"Could not parse date '{date_str}': {last_err}")
+# Columns of the combined csv / parquet output
+COMBINED_COLUMNS = ["time_utc", "station_id", "PRES_hPa", "HGHT_m", "TEMP_C"]
+
+# (station_id, station_name, when, pressures_hPa, altitudes_m, temperatures_C)
+Sounding = Tuple[str, Optional[str], dt.datetime, List[float], List[float], List[float]]
 
 
 def parse_hours(hours_str: str) -> List[int]:
@@ -89,6 +107,140 @@ def daterange(start_date: dt.date, end_date: dt.date):
         yield start_date + dt.timedelta(days=i)
 
 
+def sounding_times(start_date: dt.date, end_date: dt.date, hours: List[int]) -> List[dt.datetime]:
+    """
+    Return all sounding times (UTC) at the given hours of every day
+    from start_date to end_date inclusive, in chronological order.
+    """
+    offsets = [dt.timedelta(hours=h) for h in sorted(hours)]
+    return [
+        dt.datetime.combine(day, dt.time()) + offset
+        for day in daterange(start_date, end_date)
+        for offset in offsets
+    ]
+
+
+async def download_all(
+    jobs: List[Tuple[str, dt.datetime]],
+    sep_char: str,
+    outdir: Optional[str],
+    session: Optional[HTTPSession] = None,
+    force: bool = False,
+    no_cache: bool = False,
+    gzipped: bool = False,
+    max_concurrent: int = MAX_CONCURRENT_REQUESTS,
+    save_files: bool = True,
+    results: Optional[List[Sounding]] = None,
+) -> List[Tuple[dt.datetime, str]]:
+    """
+    Download all (station_id, when) jobs concurrently.
+
+    At most max_concurrent soundings are in flight at once. All requests
+    share `session`, so each worker thread reuses its keep-alive connection.
+    force / no_cache / gzipped are passed to fetch_sounding.
+    The station name found by the first completed sounding of a station is
+    passed to all later ones, so it is not parsed again for every request.
+    Cached files whose name is unknown (None) do not seed it.
+    Progress is printed as each sounding completes, so lines may appear
+    out of order.
+
+    With save_files=False no per-sounding files are written. If results
+    is given, every successful sounding is appended to it as
+    (station_id, station_name, when, p_hPa, z_m, T_C), in completion order.
+
+    Returns the failures as (when, reason) tuples, sorted by time.
+    """
+    failures: List[Tuple[dt.datetime, str]] = []
+    station_names: Dict[str, str] = {}
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def run(executor: ThreadPoolExecutor, station_id: str, when: dt.datetime) -> None:
+        stamp = when.strftime("%Y-%m-%d %H:%M")
+        async with semaphore:
+            try:
+                outfile, station_name, p_hPa, z_m, T_C = await fetch_sounding_async(
+                    station_id=station_id,
+                    when=when,
+                    sep_char=sep_char,
+                    outdir=outdir,
+                    session=session,
+                    force=force,
+                    no_cache=no_cache,
+                    station_name=station_names.get(station_id),
+                    gzipped=gzipped,
+                    save_file=save_files,
+                    executor=executor,
+                )
+            except Exception as e:
+                print(f"  Failed: {stamp} UTC -> {e}")
+                failures.append((when, str(e)))
+                return
+            if station_name is not None:
+                station_names.setdefault(station_id, station_name)
+
+        if results is not None:
+            results.append((station_id, station_name, when, p_hPa, z_m, T_C))
+        print(f"  OK: {outfile or stamp + ' UTC'} (levels: {len(p_hPa)})")
+
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        await asyncio.gather(*(run(executor, station_id, when) for station_id, when in jobs))
+
+    failures.sort()
+    return failures
+
+
+def write_combined_csv(
+    path: str,
+    soundings: List[Sounding],
+    sep_char: str = ",",
+    gzipped: bool = False,
+) -> None:
+    """
+    Write all soundings into one delimited table with COMBINED_COLUMNS,
+    one row per level. gzipped=True compresses it like the per-sounding files.
+    """
+    if gzipped:
+        raw = gzip.GzipFile(path, mode="wb", compresslevel=1, mtime=0)
+        f = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+    else:
+        f = open(path, "w", encoding="utf-8", newline="")
+
+    with f:
+        writer = csv.writer(f, delimiter=sep_char, lineterminator="\n")
+        writer.writerow(COMBINED_COLUMNS)
+        for station_id, _, when, p_hPa, z_m, T_C in soundings:
+            stamp = when.strftime("%Y-%m-%d %H:%M")
+            writer.writerows((stamp, station_id, p, z, T) for p, z, T in zip(p_hPa, z_m, T_C))
+
+
+def write_combined_parquet(path: str, soundings: List[Sounding]) -> None:
+    """
+    Write all soundings into one ZSTD compressed Parquet file with
+    COMBINED_COLUMNS. Requires pyarrow.
+    """
+    schema = pa.schema([
+        ("time_utc", pa.timestamp("s")),
+        ("station_id", pa.string()),
+        ("PRES_hPa", pa.float64()),
+        ("HGHT_m", pa.float64()),
+        ("TEMP_C", pa.float64()),
+    ])
+    batches = []
+    for station_id, _, when, p_hPa, z_m, T_C in soundings:
+        n = len(p_hPa)
+        batches.append(pa.RecordBatch.from_arrays(
+            [
+                pa.array([when] * n, type=pa.timestamp("s")),
+                pa.array([station_id] * n, type=pa.string()),
+                pa.array(p_hPa, type=pa.float64()),
+                pa.array(z_m, type=pa.float64()),
+                pa.array(T_C, type=pa.float64()),
+            ],
+            schema=schema,
+        ))
+    pq.write_table(pa.Table.from_batches(batches, schema=schema), path, compression="zstd")
+
+
 def main(argv=None) -> int:
     parser = argparse.ArgumentParser(
         description="Batch download Wyoming upper air soundings for a date range."
@@ -122,12 +274,41 @@ def main(argv=None) -> int:
         help="Optional base output directory. "
              "If omitted, uses 'radiosoundings/<station_name>/' like the single downloader.",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download again and overwrite soundings that were already saved by a previous run.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always ask the server, reusing a saved file only if it reports the sounding as not modified.",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Save soundings gzip compressed (.txt.gz).",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=["files", "csv", "parquet"],
+        default="files",
+        help="'files' (default): one file per sounding. "
+             "'csv' / 'parquet': one combined table for the whole range "
+             "(parquet requires pyarrow and ignores --sep and --gzip).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=MAX_CONCURRENT_REQUESTS,
+        help=f"Number of soundings downloaded in parallel (default: {MAX_CONCURRENT_REQUESTS}).",
+    )
 
     args = parser.parse_args(argv)
 
     try:
-        start_date = parse_date_only(args.start_date)
-        end_date = parse_date_only(args.end_date)
+        start_date = parse_date(args.start_date)
+        end_date = parse_date(args.end_date)
     except ValueError as e:
         print(f"Error parsing dates: {e}", file=sys.stderr)
         return 1
@@ -138,46 +319,66 @@ def main(argv=None) -> int:
         print(f"Error parsing hours: {e}", file=sys.stderr)
         return 1
 
+    if args.workers < 1:
+        print("Error: --workers must be at least 1.", file=sys.stderr)
+        return 1
+
+    if args.output_format == "parquet" and pa is None:
+        print("Error: --output-format parquet requires pyarrow (pip install pyarrow).", file=sys.stderr)
+        return 1
+
     sep_char = "," if args.sep == "comma" else "\t"
 
     print(f"Station: {args.station}")
     print(f"Date range: {start_date} to {end_date}")
     print(f"Hours (UTC): {hours}")
     print(f"Separator: {repr(sep_char)}")
+    print(f"Parallel downloads: {args.workers}")
+    print(f"Output format: {args.output_format}")
     if args.outdir:
         print(f"Output directory base: {args.outdir}")
     else:
         print("Output directory base: radiosoundings/<station_name>/")
 
-    failures = []
-
-    for current_date in daterange(start_date, end_date):
-        for hour in hours:
-            when = dt.datetime(
-                year=current_date.year,
-                month=current_date.month,
-                day=current_date.day,
-                hour=hour,
-                minute=0,
-                second=0,
+    jobs = [(args.station, when) for when in sounding_times(start_date, end_date, hours)]
+
+    print(f"\nRequesting {len(jobs)} soundings...")
+
+    save_files = args.output_format == "files"
+    soundings: List[Sounding] = []
+
+    with HTTPSession() as session:
+        failures = asyncio.run(
+            download_all(
+                jobs,
+                sep_char,
+                args.outdir,
+                session=session,
+                force=args.force,
+                no_cache=args.no_cache,
+                gzipped=args.gzip,
+                max_concurrent=args.workers,
+                save_files=save_files,
+                results=None if save_files else soundings,
             )
-
-            stamp = when.strftime("%Y-%m-%d %H:%M")
-            print(f"\nRequesting sounding for {stamp} UTC...")
-
-            try:
-                outfile, station_name, p_hPa, z_m, T_C = fetch_sounding(
-                    station_id=args.station,
-                    when=when,
-                    sep_char=sep_char,
-                    outdir=args.outdir,
-                )
-            except Exception as e:
-                print(f"  Failed: {e}")
-                failures.append((when, str(e)))
-                continue
-
-            print(f"  OK: {outfile} (levels: {len(p_hPa)})")
+        )
+
+    if not save_files:
+        if soundings:
+            soundings.sort(key=lambda s: s[2])
+            base_dir = ensure_output_dir(soundings[0][1], args.outdir)
+            name = f"{start_date:%Y%m%d}_{end_date:%Y%m%d}_{args.station}"
+            if args.output_format == "parquet":
+                outfile = os.path.join(base_dir, name + ".parquet")
+                write_combined_parquet(outfile, soundings)
+            else:
+                outfile = os.path.join(base_dir, name + (".csv" if sep_char == "," else ".tsv"))
+                if args.gzip:
+                    outfile += ".gz"
+                write_combined_csv(outfile, soundings, sep_char, gzipped=args.gzip)
+            print(f"\nSaved {len(soundings)} soundings to: {outfile}")
+        else:
+            print("\nNo soundings downloaded, combined file not written.")
 
     if failures:
         print("\nSummary of failures:")
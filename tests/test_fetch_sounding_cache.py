@@ -0,0 +1,155 @@
+"""
+Tests for the saved-file cache decisions of fetch_sounding, against a local
+server that serves a minimal Wyoming page.
+
+Run from the repository root with:
+    python -m unittest discover tests
+"""
+import datetime as dt
+import http.server
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import wyoming_sounding_downloader_2025_11_25_v02_LB as downloader  # noqa: E402
+
+STATION_ID = "15420"
+STATION_NAME = "Bucuresti_Inmh-Banesa"
+WHEN = dt.datetime(2025, 11, 2, 0)
+ETAG = '"0200"'
+
+PAGE = (
+    "<HTML>\n<H2>15420 LRBS Bucuresti Inmh-Banesa Observations at 00Z 02 Nov 2025</H2>\n<PRE>\n"
+    + downloader.START_MARKER + "\n"
+    + " 1000.0     86   12.4   11.2     92   8.45     50      4  285.1  309.3  286.6\n"
+    + "  925.0    762    8.2    6.1     87   6.40     90      9  287.6  306.0  288.7\n"
+    + "  850.0   1491    3.0   -1.0     75   4.05    120     12  289.6  301.5  290.3\n"
+    + downloader.END_MARKER
+    + "\n   Station identifier: LRBS\n</PRE>\n</HTML>\n"
+).encode("latin-1")
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        if_none_match = self.headers.get("If-None-Match")
+        self.requests.append(if_none_match)
+        if if_none_match == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchSoundingCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        cls.server.daemon_threads = True
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/sounding"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        del _Handler.requests[:]
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.outdir = os.path.join(self.tmp, "out")
+        patcher = mock.patch.object(downloader, "BASE_URL", self.base_url)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fetch(self, **kwargs):
+        kwargs.setdefault("outdir", self.outdir)
+        return downloader.fetch_sounding(STATION_ID, WHEN, **kwargs)
+
+    def test_saved_file_is_a_cache_hit(self):
+        outfile, name, p_hPa, z_m, T_C = self.fetch()
+        self.assertEqual(name, STATION_NAME)
+        self.assertEqual(self.fetch(), (outfile, name, p_hPa, z_m, T_C))
+        self.assertEqual(len(_Handler.requests), 1)
+        self.assertEqual(p_hPa, [1000.0, 925.0, 850.0])
+
+    def test_separator_mismatch_is_a_miss(self):
+        outfile = self.fetch(sep_char=",")[0]
+        self.assertEqual(self.fetch(sep_char="\t")[0], outfile)
+        self.assertEqual(len(_Handler.requests), 2)
+        with open(outfile, encoding="utf-8") as f:
+            self.assertIn("PRES\tHGHT", f.read())
+        # Now saved with tabs, so a tab run hits the cache
+        self.fetch(sep_char="\t")
+        self.assertEqual(len(_Handler.requests), 2)
+
+    def test_separator_ignored_without_saving(self):
+        outfile = self.fetch(sep_char=",")[0]
+        self.assertEqual(self.fetch(sep_char="\t", save_file=False)[0], outfile)
+        self.assertEqual(len(_Handler.requests), 1)
+
+    def test_cached_name_read_from_station_names_file(self):
+        self.fetch()
+        self.assertTrue(
+            os.path.isfile(os.path.join(self.outdir, downloader.STATION_NAMES_FILE))
+        )
+        self.assertEqual(self.fetch()[1], STATION_NAME)
+        self.assertEqual(len(_Handler.requests), 1)
+
+    def test_cached_name_is_none_when_not_recorded(self):
+        self.fetch()
+        os.remove(os.path.join(self.outdir, downloader.STATION_NAMES_FILE))
+        outfile, name = self.fetch()[:2]
+        self.assertTrue(os.path.isfile(outfile))
+        self.assertIsNone(name)
+        self.assertEqual(len(_Handler.requests), 1)
+
+    def test_cached_name_from_folder_in_default_layout(self):
+        cwd = os.getcwd()
+        os.chdir(self.tmp)
+        self.addCleanup(os.chdir, cwd)
+        outfile = self.fetch(outdir=None)[0]
+        self.assertEqual(
+            os.path.dirname(outfile), os.path.join("radiosoundings", STATION_NAME)
+        )
+        self.assertEqual(self.fetch(outdir=None)[:2], (outfile, STATION_NAME))
+        self.assertFalse(os.path.exists(os.path.join(
+            "radiosoundings", STATION_NAME, downloader.STATION_NAMES_FILE
+        )))
+
+    def test_not_modified_reuses_file(self):
+        outfile, name, p_hPa, z_m, T_C = self.fetch()
+        with open(outfile + ".etag", encoding="utf-8") as f:
+            self.assertEqual(f.read().strip(), ETAG)
+        stat = os.stat(outfile)
+
+        self.assertEqual(self.fetch(no_cache=True), (outfile, name, p_hPa, z_m, T_C))
+        self.assertEqual(_Handler.requests, [None, ETAG])
+        self.assertEqual(os.stat(outfile).st_mtime_ns, stat.st_mtime_ns)
+
+    def test_force_downloads_again(self):
+        self.fetch()
+        self.fetch(force=True)
+        self.assertEqual(_Handler.requests, [None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
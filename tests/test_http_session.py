@@ -0,0 +1,173 @@
+"""
+Regression tests for HTTPSession connection reuse after network errors
+and proxy support.
+
+Run from the repository root with:
+    python -m unittest discover tests
+"""
+import base64
+import http.server
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wyoming_sounding_downloader_2025_11_25_v02_LB import (  # noqa: E402
+    HTTPSession,
+    _download_page,
+    download_sounding_text,
+)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    user_agents = []
+
+    def do_GET(self):
+        self.user_agents.append(self.headers.get("User-Agent"))
+        if self.path == "/slow":
+            # Answer only after the client has timed out
+            time.sleep(1.0)
+            self._send(b"slow")
+        elif self.path == "/stall":
+            # Send the headers and part of the body, then stall
+            self.send_response(200)
+            self.send_header("Content-Length", "1000")
+            self.end_headers()
+            self.wfile.write(b"partial...")
+            self.wfile.flush()
+            time.sleep(1.0)
+        else:
+            self._send(b"ok")
+
+    def _send(self, body):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _ProxyHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path, self.headers.get("Proxy-Authorization")))
+        body = b"proxied"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_CONNECT(self):
+        self.requests.append(("CONNECT", self.path, self.headers.get("Proxy-Authorization")))
+        self.send_response(502)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # The client closing timed-out connections is expected here
+        pass
+
+
+class HTTPSessionErrorRecoveryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = _Server(("127.0.0.1", 0), _Handler)
+        cls.base = f"http://127.0.0.1:{cls.server.server_address[1]}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_request_after_timeout_succeeds(self):
+        with HTTPSession(timeout=0.3) as session:
+            self.assertEqual(session.get(self.base + "/fast")[2], b"ok")
+            with self.assertRaises(socket.timeout):
+                session.get(self.base + "/slow")
+            status, _, body = session.get(self.base + "/fast")
+            self.assertEqual((status, body), (200, b"ok"))
+
+    def test_request_after_body_read_failure_succeeds(self):
+        with HTTPSession(timeout=0.3) as session:
+            with self.assertRaises(socket.timeout):
+                download_sounding_text(self.base + "/stall", session=session)
+            self.assertEqual(download_sounding_text(self.base + "/fast", session=session), "ok")
+
+    def test_request_after_streamed_read_failure_succeeds(self):
+        with HTTPSession(timeout=0.3) as session:
+            with self.assertRaises(socket.timeout):
+                _download_page(self.base + "/stall", session=session)
+            self.assertEqual(_download_page(self.base + "/fast", session=session)[0], "ok")
+
+    def test_sends_urllib_user_agent(self):
+        with HTTPSession() as session:
+            session.get(self.base + "/fast")
+        self.assertEqual(_Handler.user_agents[-1], HTTPSession.USER_AGENT)
+        self.assertTrue(HTTPSession.USER_AGENT.startswith("Python-urllib/"))
+
+
+class HTTPSessionProxyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = [_Server(("127.0.0.1", 0), h) for h in (_Handler, _ProxyHandler)]
+        cls.base, cls.proxy = (
+            f"http://127.0.0.1:{srv.server_address[1]}" for srv in cls.servers
+        )
+        for srv in cls.servers:
+            threading.Thread(target=srv.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        for srv in cls.servers:
+            srv.shutdown()
+            srv.server_close()
+
+    def setUp(self):
+        del _ProxyHandler.requests[:]
+
+    def _env(self, **env):
+        clean = {k: "" for k in os.environ if k.lower().endswith("_proxy")}
+        return mock.patch.dict(os.environ, {**clean, **env})
+
+    def test_http_goes_through_proxy(self):
+        proxy = self.proxy.replace("http://", "http://user:secret@")
+        with self._env(http_proxy=proxy), HTTPSession(timeout=5) as session:
+            status, _, body = session.get("http://sounding.invalid/fast?x=1")
+        self.assertEqual((status, body), (200, b"proxied"))
+        auth = "Basic " + base64.b64encode(b"user:secret").decode("ascii")
+        self.assertEqual(
+            _ProxyHandler.requests, [("GET", "http://sounding.invalid/fast?x=1", auth)]
+        )
+
+    def test_https_is_tunnelled_through_proxy(self):
+        with self._env(https_proxy=self.proxy), HTTPSession(timeout=5) as session:
+            with self.assertRaises(OSError):
+                session.get("https://sounding.invalid/fast")
+        self.assertEqual(_ProxyHandler.requests, [("CONNECT", "sounding.invalid:443", None)])
+
+    def test_no_proxy_connects_directly(self):
+        with self._env(http_proxy=self.proxy, no_proxy="127.0.0.1"), HTTPSession() as session:
+            self.assertEqual(session.get(self.base + "/fast")[2], b"ok")
+        self.assertEqual(_ProxyHandler.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
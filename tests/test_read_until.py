@@ -0,0 +1,72 @@
+"""
+Tests for the chunked early-stop reader used by fetch_sounding.
+
+Run from the repository root with:
+    python -m unittest discover tests
+"""
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from wyoming_sounding_downloader_2025_11_25_v02_LB import (  # noqa: E402
+    END_MARKER,
+    _read_until,
+)
+
+CHUNK_SIZES = (1, 7, 50, len(END_MARKER) - 1, len(END_MARKER), 8192)
+
+
+class ReadUntilTest(unittest.TestCase):
+    def check(self, body, marker, chunk_size):
+        idx = body.find(marker) if marker is not None else -1
+        expected = body if idx == -1 else body[:idx + len(marker)]
+        resp = io.BytesIO(body.encode("latin-1"))
+        self.assertEqual(_read_until(resp, marker, chunk_size), expected)
+
+    def test_marker_at_every_offset(self):
+        # Shift the marker across chunk boundaries, including splits
+        # between two chunks at every position inside the marker
+        for chunk_size in CHUNK_SIZES:
+            for offset in range(0, 2 * len(END_MARKER) + 3):
+                body = "x" * offset + END_MARKER + "\nindices that are never used\n"
+                with self.subTest(chunk_size=chunk_size, offset=offset):
+                    self.check(body, END_MARKER, chunk_size)
+
+    def test_stops_at_first_marker(self):
+        body = "data" + END_MARKER + "more" + END_MARKER + "tail"
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.check(body, END_MARKER, chunk_size)
+
+    def test_marker_at_end_of_body(self):
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.check("data" + END_MARKER, END_MARKER, chunk_size)
+
+    def test_missing_marker_returns_whole_body(self):
+        # Only a prefix of the marker: must not be mistaken for a match
+        body = "data" + END_MARKER[:-1] + " and the rest"
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.check(body, END_MARKER, chunk_size)
+
+    def test_no_marker_returns_whole_body(self):
+        for chunk_size in CHUNK_SIZES:
+            with self.subTest(chunk_size=chunk_size):
+                self.check("data" + END_MARKER + "tail", None, chunk_size)
+
+    def test_single_character_marker(self):
+        for chunk_size in CHUNK_SIZES:
+            for offset in range(5):
+                with self.subTest(chunk_size=chunk_size, offset=offset):
+                    self.check("x" * offset + "#rest#", "#", chunk_size)
+
+    def test_empty_body(self):
+        self.assertEqual(_read_until(io.BytesIO(b""), END_MARKER), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -17,16 +17,32 @@ Library usage example:
     outfile, station_name, p_hPa, z_m, T_C = fetch_sounding(
         "15420", when, sep_char=",", outdir=None
     )
+
+    # Inside an asyncio coroutine:
+    outfile, station_name, p_hPa, z_m, T_C = await fetch_sounding_async(
+        "15420", when
+    )
 """
 import argparse
+import asyncio
+import base64
 import datetime as dt
+import email.utils
+import functools
+import glob
+import gzip
 import html
+import http.client
+import json
 import os
 import re
 import sys
+import threading
+import urllib.error
 import urllib.parse
 import urllib.request
-from typing import List, Optional, Tuple
+from concurrent.futures import Executor
+from typing import Dict, List, Optional, Set, Tuple
 
 
 BASE_URL = "http://weather.uwyo.edu/cgi-bin/sounding"
@@ -42,19 +58,93 @@ START_MARKER = (
 # End marker in the HTML output
 END_MARKER = "</PRE><H3>Station information and sounding indices</H3><PRE>"
 
+# Header block written at the top of every saved file, one per separator
+_HEADER_COMMA = (
+    "-----------------------------------------------------------------------------\n"
+    "PRES,HGHT,TEMP,DWPT,RELH,MIXR,DRCT,SKNT,THTA,THTE,THTV\n"
+    "hPa,m,C,C,%,g/kg,deg,knot,K,K,K\n"
+    "-----------------------------------------------------------------------------\n"
+)
+_HEADER_TAB = _HEADER_COMMA.replace(",", "\t")
+
+# Page title holding the station name, e.g. <H2>15420 LRBS Bucuresti ...</H2>
+_H2_RE = re.compile(r"<H2>(.*?)</H2>", re.IGNORECASE | re.DOTALL)
+
+# Characters not allowed in the station folder name
+_SANITIZE_RE = re.compile(r"[^A-Za-z0-9_\-]+")
+
+# Accepted dates, one alternative per format:
+#   YYYY-MM-DD (groups 1-3), YYYYMMDD (groups 4-6), DD.MM.YYYY (groups 7-9)
+_DATE_RE = re.compile(
+    r"(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"|(\d{4})(\d{2})(\d{2})"
+    r"|(\d{1,2})\.(\d{1,2})\.(\d{4})"
+)
+
+# Accepted times once ':' is removed: HHMM (group 1) or H / HH (group 2)
+_TIME_RE = re.compile(r"(\d{2})\d{2}|(\d{1,2})")
+
+# Output directories already created by this process
+_MKDIR_CACHE: Set[str] = set()
+
+# Per-directory {station_id: station_name} file, written in an explicit
+# outdir where the folder name does not give the station name
+STATION_NAMES_FILE = "station_names.json"
+_STATION_NAMES_LOCK = threading.Lock()
+# (directory, station_id, station_name) entries already in STATION_NAMES_FILE
+_STATION_NAMES_SAVED: Set[Tuple[str, str, str]] = set()
+
 
 def build_url(station_id: str, when: dt.datetime) -> str:
     """Build the Wyoming sounding URL for a given station and datetime (UTC)."""
-    params = {
-        "region": "europe",
-        "TYPE": "TEXT:LIST",
-        "YEAR": f"{when.year:04d}",
-        "MONTH": f"{when.month:02d}",
-        "FROM": f"{when.day:02d}{when.hour:02d}",  # DDHH
-        "TO": f"{when.day:02d}{when.hour:02d}",    # DDHH
-        "STNM": station_id,
-    }
-    return BASE_URL + "?" + urllib.parse.urlencode(params)
+    # Same query string urlencode() produced, filled in directly.
+    # Numeric station IDs need no escaping; anything else is quoted as before.
+    if station_id.isascii() and station_id.isdigit():
+        stnm = station_id
+    else:
+        stnm = urllib.parse.quote_plus(station_id)
+    ddhh = f"{when.day:02d}{when.hour:02d}"
+    return (
+        f"{BASE_URL}?region=europe&TYPE=TEXT%3ALIST"
+        f"&YEAR={when.year:04d}&MONTH={when.month:02d}"
+        f"&FROM={ddhh}&TO={ddhh}&STNM={stnm}"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def parse_date(date_str: str) -> dt.date:
+    """
+    Parse a date string into a date object.
+
+    Accepted formats:
+        YYYYMMDD
+        YYYY-MM-DD
+        DD.MM.YYYY
+
+    YYYYMMDD must be exactly 8 digits; month and day may have 1 or 2
+    digits in the other formats. Unlike the former strptime parsing,
+    spaces and 6-7 digit compact dates (e.g. 2025112) are rejected.
+
+    Results are cached, so repeated dates (e.g. from a config file or a
+    batch range) are parsed only once per process.
+    """
+    # One regex match picks the format, no strptime attempts
+    m = _DATE_RE.fullmatch(date_str)
+    if m is None:
+        raise ValueError(
+            f"Could not parse date '{date_str}': expected YYYYMMDD, YYYY-MM-DD or DD.MM.YYYY"
+        )
+    if m.group(1):
+        year, month, day = m.group(1, 2, 3)
+    elif m.group(4):
+        year, month, day = m.group(4, 5, 6)
+    else:
+        day, month, year = m.group(7, 8, 9)
+
+    try:
+        return dt.date(int(year), int(month), int(day))
+    except ValueError as e:
+        raise ValueError(f"Could not parse date '{date_str}': {e}") from None
 
 
 def parse_date_time(date_str: str, time_str: str) -> dt.datetime:
@@ -73,39 +163,203 @@ def parse_date_time(date_str: str, time_str: str) -> dt.datetime:
 
     Minutes are forced to 00 since Wyoming uses 00 only.
     """
-    # Parse date
-    date_formats = ["%Y%m%d", "%Y-%m-%d", "%d.%m.%Y"]
-    last_err: Optional[Exception] = None
-    for f in date_formats:
-        try:
-            d = dt.datetime.strptime(date_str, f)
-            break
-        except ValueError as e:
-            last_err = e
-    else:
-        raise ValueError(f"Could not parse date '{date_str}': {last_err}")
+    d = parse_date(date_str)
 
     # Parse time
-    t = time_str.replace(":", "").strip()
-    if len(t) == 1:
-        t = "0" + t
-    if len(t) == 2:
-        t = t + "00"
-    if len(t) != 4 or not t.isdigit():
+    m = _TIME_RE.fullmatch(time_str.replace(":", "").strip())
+    if m is None:
         raise ValueError(f"Time must be HH or HHMM (or HH:MM), got '{time_str}'")
+    hour = int(m.group(1) or m.group(2))
 
-    hour = int(t[:2])
-    minute = int(t[2:4])
-    # Wyoming uses 00 minutes only
-    minute = 0
+    # Wyoming uses 00 minutes only, so any given minutes are dropped
+    try:
+        return dt.datetime(d.year, d.month, d.day, hour, 0)
+    except ValueError as e:
+        raise ValueError(f"Invalid time '{time_str}': {e}") from None
+
+
+# HTTPSession pool entry: (connection, whether the request line needs the
+# absolute URL (plain http proxy), extra headers for every request on it)
+_PoolEntry = Tuple[http.client.HTTPConnection, bool, Dict[str, str]]
+
+
+class HTTPSession:
+    """
+    Keep-alive HTTP connection pool for repeated requests to the same host.
+
+    Each thread keeps one persistent connection per (scheme, host), so a
+    batch of soundings pays the DNS/TCP (and TLS) setup once per worker
+    thread instead of once per request. Redirects are followed.
+    Proxies are taken from the environment (http_proxy, https_proxy,
+    no_proxy) as urllib.request.urlopen does.
 
-    return d.replace(hour=hour, minute=minute)
+    Use as a context manager, or call close() when done:
 
+        with HTTPSession() as session:
+            fetch_sounding("15420", when, session=session)
+    """
+
+    REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+    # Same User-Agent urllib.request.urlopen sends
+    USER_AGENT = f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}"
+
+    def __init__(self, timeout: float = 60.0, max_redirects: int = 5) -> None:
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[http.client.HTTPConnection] = []
+
+    def __enter__(self) -> "HTTPSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close every connection opened by any thread."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def _connection(self, scheme: str, netloc: str) -> _PoolEntry:
+        pool: Optional[Dict[Tuple[str, str], _PoolEntry]]
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+
+        entry = pool.get((scheme, netloc))
+        if entry is None:
+            entry = pool[(scheme, netloc)] = self._new_connection(scheme, netloc)
+            with self._lock:
+                self._connections.append(entry[0])
+        return entry
+
+    def _new_connection(self, scheme: str, netloc: str) -> _PoolEntry:
+        proxy = urllib.request.getproxies().get(scheme)
+        if not proxy or urllib.request.proxy_bypass(netloc):
+            if scheme == "https":
+                return http.client.HTTPSConnection(netloc, timeout=self.timeout), False, {}
+            return http.client.HTTPConnection(netloc, timeout=self.timeout), False, {}
+
+        # Same proxy URL forms as urllib: host:port or scheme://[user:pass@]host:port
+        if "://" not in proxy:
+            proxy = "http://" + proxy
+        parts = urllib.parse.urlsplit(proxy)
+        proxy_headers: Dict[str, str] = {}
+        if parts.username is not None:
+            user_pass = (
+                f"{urllib.parse.unquote(parts.username)}:"
+                f"{urllib.parse.unquote(parts.password or '')}"
+            )
+            proxy_headers["Proxy-Authorization"] = (
+                "Basic " + base64.b64encode(user_pass.encode()).decode("ascii")
+            )
+        proxy_netloc = parts.netloc.rpartition("@")[2]
+
+        if scheme == "https":
+            # CONNECT tunnel through the proxy, TLS to the target host
+            conn = http.client.HTTPSConnection(proxy_netloc, timeout=self.timeout)
+            conn.set_tunnel(netloc, headers=proxy_headers)
+            return conn, False, {}
+        return http.client.HTTPConnection(proxy_netloc, timeout=self.timeout), True, proxy_headers
+
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        GET url over a pooled connection.
+
+        Returns (status, response headers, body). Error statuses (>= 400)
+        raise urllib.error.HTTPError like urllib.request.urlopen does;
+        304 Not Modified is returned to the caller.
+        """
+        with self.open(url, headers=headers) as resp:
+            try:
+                return resp.status, resp.headers, resp.read()
+            except BaseException:
+                self.abort()
+                raise
+
+    def open(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> http.client.HTTPResponse:
+        """
+        Like get(), but return the response with its body still unread.
+
+        The caller must read the body to the end before this thread sends
+        its next request. If reading fails part-way, call abort().
+        """
+        headers = {"User-Agent": self.USER_AGENT, **(headers or {})}
+        for _ in range(self.max_redirects + 1):
+            parts = urllib.parse.urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+
+            conn, absolute, extra_headers = self._connection(parts.scheme, parts.netloc)
+            if absolute:
+                # Plain http proxy: the request line carries the full URL
+                path = f"{parts.scheme}://{parts.netloc}{path}"
+            request_headers = {**headers, **extra_headers}
+            self._local.last = conn
+            try:
+                try:
+                    conn.request("GET", path, headers=request_headers)
+                    resp = conn.getresponse()
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    # The server dropped the idle keep-alive connection; retry once
+                    conn.close()
+                    conn.request("GET", path, headers=request_headers)
+                    resp = conn.getresponse()
+
+                location = resp.getheader("Location")
+                redirect = resp.status in self.REDIRECT_CODES and location
+                if redirect or resp.status >= 400:
+                    # Read the full body so the connection can be reused
+                    resp.read()
+            except BaseException:
+                # Timeouts, refused connections etc. leave the connection
+                # mid-request; close it so the next request reconnects
+                conn.close()
+                raise
+
+            if redirect:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            if resp.status >= 400:
+                raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+            return resp
+
+        raise RuntimeError(f"Too many redirects while fetching {url}")
+
+    def abort(self) -> None:
+        """
+        Close the connection used by this thread's last open() call.
+
+        Needed when reading a response body fails part-way: the unread
+        bytes must not be taken for the next response on that connection.
+        The next request reconnects automatically.
+        """
+        conn = getattr(self._local, "last", None)
+        if conn is not None:
+            conn.close()
+
+
+def download_sounding_text(url: str, session: Optional[HTTPSession] = None) -> str:
+    """
+    Download the raw HTML sounding page from Wyoming.
 
-def download_sounding_text(url: str) -> str:
-    """Download the raw HTML sounding page from Wyoming."""
-    with urllib.request.urlopen(url) as resp:
-        data = resp.read()
+    If session is given its pooled keep-alive connections are reused.
+    """
+    if session is not None:
+        data = session.get(url)[2]
+    else:
+        with urllib.request.urlopen(url) as resp:
+            data = resp.read()
     # Try UTF-8 first, fall back to latin-1
     try:
         return data.decode("utf-8")
@@ -113,6 +367,88 @@ def download_sounding_text(url: str) -> str:
         return data.decode("latin-1")
 
 
+def _download_page(
+    url: str,
+    session: Optional[HTTPSession] = None,
+    etag: Optional[str] = None,
+    if_modified_since: Optional[float] = None,
+    until: Optional[str] = END_MARKER,
+) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Download the sounding page for fetch_sounding.
+
+    If session is given its pooled keep-alive connections are reused,
+    otherwise a fresh connection is opened for this request.
+
+    etag and if_modified_since (a POSIX timestamp) make the request
+    conditional, so the server can answer 304 Not Modified.
+
+    The body is read in chunks and the returned text ends right after
+    the first occurrence of `until` (by default END_MARKER), since the
+    station indices that follow are never used. Pass until=None to get
+    the whole page.
+
+    Returns:
+        raw_html - page text, or None if the server answered 304
+        etag     - ETag sent by the server, if any
+    """
+    headers: Dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if if_modified_since is not None:
+        headers["If-Modified-Since"] = email.utils.formatdate(if_modified_since, usegmt=True)
+
+    raw_html: Optional[str]
+    if session is not None:
+        with session.open(url, headers=headers) as resp:
+            resp_headers = resp.headers
+            try:
+                raw_html = None if resp.status == 304 else _read_until(resp, until)
+                # Drain the unused tail so the keep-alive connection can be reused
+                resp.read()
+            except BaseException:
+                session.abort()
+                raise
+    else:
+        try:
+            with urllib.request.urlopen(urllib.request.Request(url, headers=headers)) as resp:
+                resp_headers = resp.headers
+                raw_html = _read_until(resp, until)
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            resp_headers, raw_html = e.headers, None
+
+    return raw_html, resp_headers.get("ETag") or etag
+
+
+def _read_until(resp, marker: Optional[str], chunk_size: int = 8192) -> str:
+    """
+    Read and decode resp in chunks, stopping after the first `marker`.
+
+    Returns the text up to and including the marker, or the whole body
+    if the marker never appears (or is None).
+    """
+    parts: List[str] = []
+    tail = ""
+    for chunk in iter(lambda: resp.read(chunk_size), b""):
+        # Wyoming pages are plain ASCII. latin-1 maps every byte, so
+        # decoding never fails, needs no UTF-8 attempt first, and is
+        # safe at any chunk boundary.
+        text = chunk.decode("latin-1")
+        if marker is not None:
+            # Keep the end of the previous chunk so a marker split
+            # across two chunks is still found
+            window = tail + text
+            idx = window.find(marker)
+            if idx != -1:
+                parts.append(text[:idx + len(marker) - len(tail)])
+                break
+            tail = window[max(0, len(window) - len(marker) + 1):]
+        parts.append(text)
+    return "".join(parts)
+
+
 def extract_station_name(raw_html: str, station_id: str) -> str:
     """
     Extract the station name from the <H2> header.
@@ -123,27 +459,16 @@ def extract_station_name(raw_html: str, station_id: str) -> str:
     We keep only the name part (after ID and ICAO, before 'Observations')
     and sanitize it for use as a folder name.
     """
-    start_idx = raw_html.find("<H2>")
-    end_idx = -1
-    offset = 4
-    if start_idx != -1:
-        end_idx = raw_html.find("</H2>", start_idx + offset)
-    else:
-        start_idx = raw_html.find("<h2>")
-        if start_idx != -1:
-            end_idx = raw_html.find("</h2>", start_idx + offset)
-        else:
-            offset = 0
-
-    if start_idx != -1 and end_idx != -1:
-        header = raw_html[start_idx + offset:end_idx]
-        header = html.unescape(header).strip()
+    m = _H2_RE.search(raw_html)
+    if m is not None:
+        header = html.unescape(m.group(1)).strip()
         tokens = header.split()
         # Expected pattern: [station_number, ICAO, name..., 'Observations', ...]
-        try:
-            obs_idx = tokens.index("Observations")
-        except ValueError:
-            obs_idx = len(tokens)
+        # Matched in any casing, like the <H2> tag itself
+        obs_idx = next(
+            (i for i, tok in enumerate(tokens) if tok.lower() == "observations"),
+            len(tokens),
+        )
 
         if len(tokens) >= 3:
             name_tokens = tokens[2:obs_idx] if obs_idx > 2 else tokens[2:]
@@ -154,7 +479,7 @@ def extract_station_name(raw_html: str, station_id: str) -> str:
         raw_name = station_id
 
     # Sanitize for filesystem
-    name = re.sub(r"[^A-Za-z0-9_\-]+", "_", raw_name)
+    name = _SANITIZE_RE.sub("_", raw_name)
     name = name.strip("_") or station_id
     return name
 
@@ -164,8 +489,11 @@ def extract_block(raw_html: str) -> List[str]:
     Extract the block between the Wyoming header (three-line marker)
     and the station-indices section.
     """
-    # Normalize line endings to \n
-    text = raw_html.replace("\r\n", "\n").replace("\r", "\n")
+    # Normalize line endings to \n. Copying the whole page is the most
+    # expensive step here, so skip it when the page has no \r at all.
+    text = raw_html
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
     start_idx = text.find(START_MARKER)
     if start_idx == -1:
@@ -195,15 +523,15 @@ def normalize_lines(lines: List[str], sep: str) -> str:
     Convert variable whitespace separated columns into sep separated columns.
 
     All lines are split on arbitrary whitespace and joined with the chosen separator.
+    Kept for library use; fetch_sounding uses process_block, which does the
+    same split in its single pass.
     """
     out_lines: List[str] = []
     for line in lines:
-        stripped = line.rstrip("\n")
-        if not stripped.strip():
-            continue
-
-        parts = stripped.split()
-        out_lines.append(sep.join(parts))
+        # split() already ignores edge whitespace and gives [] for blank lines
+        parts = line.split()
+        if parts:
+            out_lines.append(sep.join(parts))
 
     return "\n".join(out_lines) + "\n"
 
@@ -228,11 +556,9 @@ def parse_profiles(lines: List[str]) -> Tuple[List[float], List[float], List[flo
     temps: List[float] = []
 
     for line in lines:
-        s = line.strip()
-        if not s:
-            continue
-
-        parts = s.split()
+        # Only the first three columns are needed; maxsplit avoids splitting
+        # the remaining eight. Blank lines give an empty list.
+        parts = line.split(None, 3)
         if len(parts) < 3:
             continue
 
@@ -251,27 +577,199 @@ def parse_profiles(lines: List[str]) -> Tuple[List[float], List[float], List[flo
     return pressures, heights, temps
 
 
+def process_block(
+    lines: List[str], sep: str
+) -> Tuple[str, List[float], List[float], List[float]]:
+    """
+    Single pass equivalent of normalize_lines followed by parse_profiles.
+
+    Each line of the block is split once; the parts are both joined with
+    sep for the output text and converted to pressure, altitude and
+    temperature.
+
+    Returns:
+        content        - normalized text, as from normalize_lines
+        pressures_hPa  - list of floats
+        altitudes_m    - list of floats
+        temperatures_C - list of floats
+    """
+    out_lines: List[str] = []
+    pressures: List[float] = []
+    heights: List[float] = []
+    temps: List[float] = []
+
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+
+        out_lines.append(sep.join(parts))
+
+        if len(parts) < 3:
+            continue
+        try:
+            p = float(parts[0])
+            z = float(parts[1])
+            T = float(parts[2])
+        except ValueError:
+            # Lines with missing data (/////) etc
+            continue
+
+        pressures.append(p)
+        heights.append(z)
+        temps.append(T)
+
+    return "\n".join(out_lines) + "\n", pressures, heights, temps
+
+
 def ensure_output_path(
     station_id: str,
     station_name: str,
     when: dt.datetime,
     outdir: Optional[str],
+    gzipped: bool = False,
 ) -> str:
     """
     Determine output directory and file path.
 
     If outdir is None:
         radiosoundings/<station_name>/yyyymmdd_hhmm_stationID.txt
+
+    With gzipped=True the file name ends in .txt.gz.
+    """
+    base_dir = ensure_output_dir(station_name, outdir)
+    return os.path.join(base_dir, output_filename(station_id, when, gzipped))
+
+
+def ensure_output_dir(station_name: str, outdir: Optional[str]) -> str:
+    """
+    Create (if needed) and return the output directory:
+    outdir, or radiosoundings/<station_name>/ if outdir is None.
     """
     if outdir is None or outdir.strip() == "":
         base_dir = os.path.join("radiosoundings", station_name)
     else:
         base_dir = outdir
 
-    os.makedirs(base_dir, exist_ok=True)
+    # Only the first sounding in a directory needs the makedirs() syscalls
+    if base_dir not in _MKDIR_CACHE:
+        os.makedirs(base_dir, exist_ok=True)
+        _MKDIR_CACHE.add(base_dir)
+
+    return base_dir
+
 
-    filename = f"{when:%Y%m%d}_{when:%H%M}_{station_id}.txt"
-    return os.path.join(base_dir, filename)
+def output_filename(station_id: str, when: dt.datetime, gzipped: bool = False) -> str:
+    """File name used for a saved sounding: yyyymmdd_hhmm_stationID.txt[.gz]"""
+    suffix = ".txt.gz" if gzipped else ".txt"
+    return f"{when:%Y%m%d}_{when:%H%M}_{station_id}{suffix}"
+
+
+def find_cached_sounding(
+    station_id: str,
+    when: dt.datetime,
+    outdir: Optional[str],
+    station_name: Optional[str] = None,
+    gzipped: bool = False,
+) -> Optional[str]:
+    """
+    Return the path of a sounding file saved by a previous run, or None.
+
+    If outdir is None and the station name is not known yet, every
+    radiosoundings/<station_name>/ folder is searched.
+    Only files in the requested format (.txt or .txt.gz) are considered.
+    """
+    filename = output_filename(station_id, when, gzipped)
+    if outdir is None or outdir.strip() == "":
+        if station_name is None:
+            matches = sorted(glob.glob(os.path.join("radiosoundings", "*", glob.escape(filename))))
+            return matches[0] if matches else None
+        outdir = os.path.join("radiosoundings", station_name)
+
+    path = os.path.join(outdir, filename)
+    return path if os.path.isfile(path) else None
+
+
+def read_sounding_file(path: str) -> Tuple[List[float], List[float], List[float]]:
+    """
+    Parse pressure, altitude and temperature back from a saved sounding file.
+
+    Works for both comma and tab separated files, plain or gzipped.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        # Skip the four-line header block written by fetch_sounding
+        lines = f.read().split("\n")[4:]
+    return parse_profiles([line.replace(",", " ") for line in lines])
+
+
+def _saved_separator(path: str) -> Optional[str]:
+    """
+    Return the separator ("," or "\t") of a saved sounding file, taken from
+    its column-name header line, or None if it cannot be determined.
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    try:
+        with opener(path, "rt", encoding="utf-8") as f:
+            f.readline()
+            names = f.readline()
+    except (OSError, EOFError, UnicodeDecodeError):
+        return None
+    if "\t" in names:
+        return "\t"
+    if "," in names:
+        return ","
+    return None
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """
+    Write data to path through a temporary file in the same directory.
+
+    The file is only renamed into place once it is complete, so a full
+    disk or a killed process never leaves a truncated file that a later
+    run would take as a valid cached sounding.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _read_etag(outfile: str) -> Optional[str]:
+    try:
+        with open(outfile + ".etag", encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _read_station_names(directory: str) -> Dict[str, str]:
+    try:
+        with open(os.path.join(directory, STATION_NAMES_FILE), encoding="utf-8") as f:
+            names = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return names if isinstance(names, dict) else {}
+
+
+def _remember_station_name(directory: str, station_id: str, station_name: str) -> None:
+    """Record station_name in directory's STATION_NAMES_FILE (once per process)."""
+    key = (directory, station_id, station_name)
+    if key in _STATION_NAMES_SAVED:
+        return
+    with _STATION_NAMES_LOCK:
+        names = _read_station_names(directory)
+        if names.get(station_id) != station_name:
+            names[station_id] = station_name
+            data = json.dumps(names, indent=2, sort_keys=True) + "\n"
+            _write_atomic(os.path.join(directory, STATION_NAMES_FILE), data.encode("utf-8"))
+        _STATION_NAMES_SAVED.add(key)
 
 
 def fetch_sounding(
@@ -279,56 +777,153 @@ def fetch_sounding(
     when: dt.datetime,
     sep_char: str = ",",
     outdir: Optional[str] = None,
-) -> Tuple[str, str, List[float], List[float], List[float]]:
+    session: Optional[HTTPSession] = None,
+    force: bool = False,
+    no_cache: bool = False,
+    station_name: Optional[str] = None,
+    gzipped: bool = False,
+    save_file: bool = True,
+) -> Tuple[Optional[str], Optional[str], List[float], List[float], List[float]]:
     """
     High level function that:
       1. Downloads the sounding
       2. Extracts the data block
       3. Saves it to a text file with chosen separator
+         (gzip compressed, .txt.gz, if gzipped=True)
       4. Returns file path, station name and profiles.
 
+    Pass an HTTPSession to reuse connections across many calls.
+
+    Caching:
+        By default, if the output file already exists from a previous run
+        it is parsed locally and nothing is downloaded. A file saved with a
+        different separator than sep_char counts as missing (and is
+        overwritten), unless save_file=False, which only needs the profiles.
+        no_cache=True always asks the server, but sends the stored ETag
+        (<outfile>.etag, written only if the server sent one) and file
+        time, and reuses the file on 304.
+        force=True always downloads and overwrites the file.
+
+    station_name:
+        If already known (e.g. returned by an earlier call for the same
+        station), it is used as is instead of being parsed from the page.
+        For a cached file the name comes from the radiosoundings/
+        <station_name>/ folder when outdir is None. In an explicit outdir
+        it is read from STATION_NAMES_FILE there; if the station is not
+        listed, the name is unknown and None is returned.
+
+    save_file:
+        With save_file=False a downloaded sounding is only parsed, not
+        written (outfile_path is then None). Previously saved files are
+        still used as cache.
+
     Returns:
         outfile_path
-        station_name
+        station_name (None if unknown, see above)
         pressures_hPa
         altitudes_m
         temperatures_C
     """
+    cached = None if force else find_cached_sounding(
+        station_id, when, outdir, station_name, gzipped
+    )
+    if cached is not None and save_file and _saved_separator(cached) != sep_char:
+        cached = None
+    if cached is not None:
+        if station_name is not None:
+            cached_name = station_name
+        elif outdir is None or outdir.strip() == "":
+            cached_name = os.path.basename(os.path.dirname(cached))
+        else:
+            cached_name = _read_station_names(os.path.dirname(cached)).get(station_id)
+        if not no_cache:
+            return (cached, cached_name) + read_sounding_file(cached)
+
     url = build_url(station_id, when)
-    raw_html = download_sounding_text(url)
+    if cached is not None:
+        raw_html, etag = _download_page(
+            url,
+            session=session,
+            etag=_read_etag(cached),
+            if_modified_since=os.path.getmtime(cached),
+        )
+    else:
+        raw_html, etag = _download_page(url, session=session)
 
-    station_name = extract_station_name(raw_html, station_id)
+    if raw_html is None:
+        # 304 Not Modified: the saved file is still current
+        return (cached, cached_name) + read_sounding_file(cached)
+
+    if station_name is None:
+        station_name = extract_station_name(raw_html, station_id)
     lines = extract_block(raw_html)
-    content = normalize_lines(lines, sep_char)
-
-    # Build header according to separator
-    if sep_char == ",":
-        name_line = "PRES,HGHT,TEMP,DWPT,RELH,MIXR,DRCT,SKNT,THTA,THTE,THTV"
-        unit_line = "hPa,m,C,C,%,g/kg,deg,knot,K,K,K"
-    else:  # tab
-        cols = ["PRES", "HGHT", "TEMP", "DWPT", "RELH", "MIXR",
-                "DRCT", "SKNT", "THTA", "THTE", "THTV"]
-        units = ["hPa", "m", "C", "C", "%", "g/kg",
-                 "deg", "knot", "K", "K", "K"]
-        name_line = "\t".join(cols)
-        unit_line = "\t".join(units)
-
-    header_block = (
-        "-----------------------------------------------------------------------------\n"
-        f"{name_line}\n"
-        f"{unit_line}\n"
-        "-----------------------------------------------------------------------------\n"
-    )
+    if not save_file:
+        p_hPa, z_m, T_C = parse_profiles(lines)
+        return None, station_name, p_hPa, z_m, T_C
+
+    content, p_hPa, z_m, T_C = process_block(lines, sep_char)
+
+    header_block = _HEADER_COMMA if sep_char == "," else _HEADER_TAB
+
+    outfile = ensure_output_path(station_id, station_name, when, outdir, gzipped)
+    # Encode once and write a single bytes buffer: one write() syscall and
+    # no text-layer newline handling (newlines are already "\n")
+    payload = (header_block + content).encode("utf-8")
+    if gzipped:
+        # Fastest level, mtime=0 so identical soundings give identical files
+        payload = gzip.compress(payload, compresslevel=1, mtime=0)
+    # Drop the old sidecar first, so an interrupted save never pairs the
+    # new file with a stale ETag
+    if os.path.exists(outfile + ".etag"):
+        os.remove(outfile + ".etag")
+    _write_atomic(outfile, payload)
+    if etag:
+        _write_atomic(outfile + ".etag", (etag + "\n").encode("utf-8"))
+    if outdir is not None and outdir.strip() != "":
+        _remember_station_name(os.path.dirname(outfile), station_id, station_name)
 
-    outfile = ensure_output_path(station_id, station_name, when, outdir)
-    with open(outfile, "w", encoding="utf-8", newline="") as f:
-        f.write(header_block)
-        f.write(content)
+    return outfile, station_name, p_hPa, z_m, T_C
 
-    p_hPa, z_m, T_C = parse_profiles(lines)
 
-    return outfile, station_name, p_hPa, z_m, T_C
+async def fetch_sounding_async(
+    station_id: str,
+    when: dt.datetime,
+    sep_char: str = ",",
+    outdir: Optional[str] = None,
+    session: Optional[HTTPSession] = None,
+    force: bool = False,
+    no_cache: bool = False,
+    station_name: Optional[str] = None,
+    gzipped: bool = False,
+    save_file: bool = True,
+    executor: Optional[Executor] = None,
+) -> Tuple[Optional[str], Optional[str], List[float], List[float], List[float]]:
+    """
+    Awaitable version of fetch_sounding for use inside an asyncio event loop.
 
+    The blocking download, parsing and file write run in `executor`
+    (the loop's default thread pool if None), so many soundings can be
+    in flight at once while the event loop stays responsive.
+
+    Returns the same tuple as fetch_sounding.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(
+            fetch_sounding,
+            station_id,
+            when,
+            sep_char=sep_char,
+            outdir=outdir,
+            session=session,
+            force=force,
+            no_cache=no_cache,
+            station_name=station_name,
+            gzipped=gzipped,
+            save_file=save_file,
+        ),
+    )
 
 
 def main(argv=None) -> int:
@@ -358,6 +953,24 @@ def main(argv=None) -> int:
             "If omitted, uses 'radiosoundings/<station_name>/'."
         ),
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Download again and overwrite the file even if it already exists.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=(
+            "Always ask the server, reusing an existing file only if it "
+            "reports the sounding as not modified."
+        ),
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Save the sounding gzip compressed (.txt.gz).",
+    )
 
     args = parser.parse_args(argv)
 
@@ -374,13 +987,19 @@ def main(argv=None) -> int:
 
     try:
         outfile, station_name, p_hPa, z_m, T_C = fetch_sounding(
-            args.station, when, sep_char=sep_char, outdir=args.outdir
+            args.station,
+            when,
+            sep_char=sep_char,
+            outdir=args.outdir,
+            force=args.force,
+            no_cache=args.no_cache,
+            gzipped=args.gzip,
         )
     except Exception as e:
         print(f"Error fetching sounding: {e}", file=sys.stderr)
         return 1
 
-    print(f"Station name: {station_name}")
+    print(f"Station name: {station_name or 'unknown (not stored with the saved file)'}")
     print(f"Saved sounding to: {outfile}")
     print(f"Parsed {len(p_hPa)} data levels.")
 